@@ -13,26 +13,56 @@ def _require_auth():
     return True
 
 
-@bp.route('/overview', methods=['GET'])
-def overview():
-    # Dashboard overview requires authentication in tests
-    if not _require_auth():
-        return jsonify({'error': 'Unauthorized'}), 401
-    return jsonify({
+def _overview_data():
+    return {
         'total_value': 0,
         'total_gain_loss': 0,
         'portfolio_count': 0,
         'top_performers': [],
         'worst_performers': []
+    }
+
+
+def _stats_data():
+    return {'total_value': 0, 'day_change': 0, 'total_return': 0}
+
+
+def _allocation_data():
+    return {'by_security': [], 'by_sector': [], 'by_platform': []}
+
+
+def _performance_data(period=None):
+    return {'time_series': [], 'period': period or ''}
+
+
+@bp.route('/bundle', methods=['GET'])
+def bundle():
+    # All headline widgets in one response so the dashboard loads with a
+    # single request instead of one per widget
+    if not _require_auth():
+        return jsonify({'error': 'Unauthorized'}), 401
+    return jsonify({
+        'overview': _overview_data(),
+        'stats': _stats_data(),
+        'allocation': _allocation_data(),
+        'performance': _performance_data(request.args.get('period'))
     })
 
 
+@bp.route('/overview', methods=['GET'])
+def overview():
+    # Dashboard overview requires authentication in tests
+    if not _require_auth():
+        return jsonify({'error': 'Unauthorized'}), 401
+    return jsonify(_overview_data())
+
+
 @bp.route('/stats', methods=['GET'])
 def stats():
     # Quick stats for dashboard
     if not _require_auth():
         return jsonify({'error': 'Unauthorized'}), 401
-    return jsonify({'total_value': 0, 'day_change': 0, 'total_return': 0})
+    return jsonify(_stats_data())
 
 
 @bp.route('/portfolios', methods=['GET'])
@@ -78,15 +108,14 @@ def upcoming_dividends():
 def allocation():
     if not _require_auth():
         return jsonify({'error': 'Unauthorized'}), 401
-    return jsonify({'by_security': [], 'by_sector': [], 'by_platform': []})
+    return jsonify(_allocation_data())
 
 
 @bp.route('/performance', methods=['GET'])
 def performance():
     if not _require_auth():
         return jsonify({'error': 'Unauthorized'}), 401
-    period = request.args.get('period', None)
-    return jsonify({'time_series': [], 'period': period or ''})
+    return jsonify(_performance_data(request.args.get('period')))
 
 
 @bp.route('/market-movers', methods=['GET'])
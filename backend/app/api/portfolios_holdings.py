@@ -5,6 +5,16 @@ from decimal import Decimal
 from app.extensions import db
 from app.api.auth import token_required
 from datetime import datetime, date
+from sqlalchemy.orm import selectinload
+
+
+def _holdings_with_securities(portfolio_id):
+    """Holdings of a portfolio with their securities loaded up front.
+
+    Endpoints that read ``holding.security`` per row would otherwise issue
+    one lazy load per holding.
+    """
+    return Holding.query.options(selectinload(Holding.security)).filter_by(portfolio_id=portfolio_id).all()
 
 @bp.route('/<int:id>/holdings/<int:holding_id>', methods=['GET'])
 @token_required
@@ -116,7 +126,7 @@ def list_holdings(current_user, id):
         min_value = request.args.get('min_value')
         sector = request.args.get('sector')
         currency = request.args.get('currency')
-        holdings = portfolio.holdings or []
+        holdings = _holdings_with_securities(id)
         results = []
         for h in holdings:
             val = h.calculate_value() if hasattr(h, 'calculate_value') else Decimal('0')
@@ -239,7 +249,7 @@ def export_holdings(current_user, id):
             return jsonify({"error": "Portfolio not found"}), 404
         if portfolio.user_id != current_user.id:
             return jsonify({"error": "Unauthorized"}), 403
-        holdings = Holding.query.filter_by(portfolio_id=id).all()
+        holdings = _holdings_with_securities(id)
         csv_lines = ['symbol,quantity,price']
         for h in holdings:
             # derive symbol from related security if available
@@ -253,7 +263,9 @@ def export_holdings(current_user, id):
         resp = Response(payload)
         # Explicitly set Content-Type to avoid Flask adding a charset
         resp.headers['Content-Type'] = 'text/csv'
-        return resp
+        # Clients re-downloading an unchanged export get a bodiless 304
+        resp.add_etag()
+        return resp.make_conditional(request)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -270,7 +282,7 @@ def get_holdings_performance(current_user, id):
             return jsonify({"error": "Unauthorized"}), 403
         # Return list of holding performance dicts
         data = []
-        for h in portfolio.holdings:
+        for h in _holdings_with_securities(id):
             try:
                 h.calculate_values()
             except Exception:
@@ -474,7 +486,7 @@ def holdings_allocation(current_user, id):
         by_security = {}
         by_sector = {}
         by_platform = {}
-        for h in portfolio.holdings or []:
+        for h in _holdings_with_securities(id):
             val = Decimal(str(h.calculate_value()))
             sec = getattr(getattr(h, 'security', None), 'symbol', None) or getattr(h, 'security_symbol', None)
             sector = getattr(getattr(h, 'security', None), 'sector', None)
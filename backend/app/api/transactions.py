@@ -2,7 +2,7 @@ from flask import Blueprint, jsonify, request
 from decimal import Decimal, InvalidOperation
 from app.models import Transaction, Holding, Portfolio
 from app.extensions import db
-from app.constants import DECIMAL_PLACES, TRANSACTION_TYPES as VALID_TRANSACTION_TYPES, CURRENCY_CODES
+from app.constants import DECIMAL_QUANTUM, TRANSACTION_TYPES as VALID_TRANSACTION_TYPES, CURRENCY_CODES
 from app.api.auth import token_required
 from datetime import datetime
 
@@ -97,15 +97,15 @@ def create_transaction(current_user):
         
         # Convert price and fees to Decimal
         try:
-            price_per_share = Decimal(str(data['price_per_share'])).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+            price_per_share = Decimal(str(data['price_per_share'])).quantize(DECIMAL_QUANTUM)
             if price_per_share <= 0:
                 return jsonify({'error': 'Price per share must be positive'}), 400
                 
-            trading_fees = Decimal(str(data.get('trading_fees', '0.0'))).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+            trading_fees = Decimal(str(data.get('trading_fees', '0.0'))).quantize(DECIMAL_QUANTUM)
             if trading_fees < 0:
                 return jsonify({'error': 'Trading fees cannot be negative'}), 400
                 
-            quantity = Decimal(str(data['quantity'])).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+            quantity = Decimal(str(data['quantity'])).quantize(DECIMAL_QUANTUM)
             if quantity <= 0:
                 return jsonify({'error': 'Quantity must be positive'}), 400
                 
@@ -220,19 +220,19 @@ def update_transaction(current_user, id):
         # Handle numeric fields with proper decimal conversion
         if 'price_per_share' in data:
             try:
-                data['price_per_share'] = Decimal(str(data['price_per_share'])).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                data['price_per_share'] = Decimal(str(data['price_per_share'])).quantize(DECIMAL_QUANTUM)
             except (ValueError, TypeError):
                 return jsonify({'error': 'Invalid price_per_share format'}), 400
         
         if 'trading_fees' in data:
             try:
-                data['trading_fees'] = Decimal(str(data['trading_fees'])).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                data['trading_fees'] = Decimal(str(data['trading_fees'])).quantize(DECIMAL_QUANTUM)
             except (ValueError, TypeError):
                 return jsonify({'error': 'Invalid trading_fees format'}), 400
         
         if 'quantity' in data:
             try:
-                data['quantity'] = Decimal(str(data['quantity'])).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                data['quantity'] = Decimal(str(data['quantity'])).quantize(DECIMAL_QUANTUM)
             except (ValueError, TypeError):
                 return jsonify({'error': 'Invalid quantity format'}), 400
         
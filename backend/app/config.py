@@ -43,6 +43,7 @@ class TestConfig(Config):
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SECRET_KEY = 'test-secret-key'
     JWT_SECRET_KEY = 'test-jwt-secret'
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1'  # Fast, insecure hashes for tests only
     SERVER_NAME = 'localhost:5000'  # Required for url_for() to work in tests
     APPLICATION_ROOT = '/'
     PREFERRED_URL_SCHEME = 'http'
\ No newline at end of file
@@ -1,5 +1,9 @@
 # Application-wide constants
+from decimal import Decimal
+
 DECIMAL_PLACES = 8
+# Quantum for quantizing amounts to DECIMAL_PLACES, i.e. Decimal('0.00000001')
+DECIMAL_QUANTUM = Decimal((0, (1,), -DECIMAL_PLACES))
 
 # Transaction types
 TRANSACTION_TYPES = {
@@ -2,7 +2,7 @@ from . import db, BaseModel
 from datetime import datetime
 from decimal import Decimal, ROUND_HALF_UP
 from sqlalchemy.orm import relationship
-from ..constants import DECIMAL_PLACES
+from ..constants import DECIMAL_QUANTUM
 
 class Holding(BaseModel):
     __tablename__ = 'holdings'
@@ -95,7 +95,7 @@ class Holding(BaseModel):
         if self.current_price is not None and self.quantity is not None:
             # Calculate current market value (quantity * price, no fees)
             self.current_value = (Decimal(str(self.current_price)) * 
-                                Decimal(str(self.quantity))).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                                Decimal(str(self.quantity))).quantize(DECIMAL_QUANTUM)
             
             # Recalculate total cost (avg cost * quantity, no fees)
             base_cost = (Decimal(str(self.average_cost)) * Decimal(str(self.quantity)))
@@ -117,7 +117,7 @@ class Holding(BaseModel):
         """
         if self.current_price is not None and self.quantity is not None:
             base_value = (Decimal(str(self.current_price)) * 
-                        Decimal(str(self.quantity))).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                        Decimal(str(self.quantity))).quantize(DECIMAL_QUANTUM)
             
             if include_fees:
                 # Include fees from transactions
@@ -218,9 +218,7 @@ class Holding(BaseModel):
         else:
             if self.quantity is not None:
                 try:
-                    # build quantize pattern without nested f-string braces
-                    pattern = '0.' + ('0' * DECIMAL_PLACES)
-                    qty_str = str(self.quantity.quantize(Decimal(pattern)))
+                    qty_str = str(self.quantity.quantize(DECIMAL_QUANTUM))
                 except Exception:
                     qty_str = str(self.quantity)
             else:
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from . import db, BaseModel
-from ..constants import DECIMAL_PLACES, CURRENCY_CODES, ACCOUNT_TYPES
+from ..constants import DECIMAL_QUANTUM, CURRENCY_CODES, ACCOUNT_TYPES
 
 class Platform(BaseModel):
     __tablename__ = 'platforms'
@@ -30,7 +30,7 @@ class Platform(BaseModel):
             fixed_fee = Decimal(str(self.trading_fee_fixed))
             percentage_fee = (amount * Decimal(str(self.trading_fee_percentage)) / 100)
             
-            return (fixed_fee + percentage_fee).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+            return (fixed_fee + percentage_fee).quantize(DECIMAL_QUANTUM)
         except (ValueError, TypeError) as e:
             raise ValueError(f"Error calculating trading fees: {str(e)}")
     
@@ -40,7 +40,7 @@ class Platform(BaseModel):
             amount = Decimal(str(amount))
             fx_fee = (amount * Decimal(str(self.fx_fee_percentage)) / 100)
             
-            return fx_fee.quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+            return fx_fee.quantize(DECIMAL_QUANTUM)
         except (ValueError, TypeError) as e:
             raise ValueError(f"Error calculating FX fees: {str(e)}")
     
@@ -53,7 +53,7 @@ class Platform(BaseModel):
             amount = Decimal(str(amount))
             stamp_duty = (amount * Decimal('0.005'))  # 0.5%
             
-            return stamp_duty.quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+            return stamp_duty.quantize(DECIMAL_QUANTUM)
         except (ValueError, TypeError) as e:
             raise ValueError(f"Error calculating stamp duty: {str(e)}")
     
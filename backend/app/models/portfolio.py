@@ -4,7 +4,7 @@ from ..extensions import db
 from sqlalchemy.orm import relationship
 from sqlalchemy import desc
 from datetime import datetime, date, timedelta
-from ..constants import DECIMAL_PLACES, CURRENCY_CODES
+from ..constants import DECIMAL_QUANTUM, CURRENCY_CODES
 from .dividend import Dividend
 from .holding import Holding
 
@@ -62,13 +62,13 @@ class PortfolioPerformance(BaseModel):
             if hasattr(self.portfolio, 'initial_value'):
                 initial_value = Decimal(str(self.portfolio.initial_value))
                 self.total_gain_loss = (Decimal(str(self.total_value)) - initial_value
-                                      ).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                                      ).quantize(DECIMAL_QUANTUM)
             
             if previous_performance:
                 prev_value = Decimal(str(previous_performance.total_value))
                 current_value = Decimal(str(self.total_value))
                 self.daily_gain_loss = (current_value - prev_value
-                                      ).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                                      ).quantize(DECIMAL_QUANTUM)
             else:
                 self.daily_gain_loss = Decimal('0')
             
@@ -155,7 +155,7 @@ class Portfolio(BaseModel):
             value = holding.calculate_value(include_fees=include_fees)
             if value:
                 total += value
-        return total.quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+        return total.quantize(DECIMAL_QUANTUM)
 
     def update_performance(self):
         """Update portfolio performance metrics."""
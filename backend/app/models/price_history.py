@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 from sqlalchemy import desc
 from sqlalchemy.orm import relationship
 from . import db, BaseModel
-from ..constants import DECIMAL_PLACES
+from ..constants import DECIMAL_PLACES, DECIMAL_QUANTUM
 
 class PriceHistory(BaseModel):
     __tablename__ = 'price_history'
@@ -94,7 +94,7 @@ class PriceHistory(BaseModel):
                 return None, None
 
             change = (Decimal(str(self.close_price)) -
-                      Decimal(str(self.open_price))).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                      Decimal(str(self.open_price))).quantize(DECIMAL_QUANTUM)
 
             if Decimal(str(self.open_price)) == 0:
                 change_pct = Decimal('0')
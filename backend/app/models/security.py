@@ -4,7 +4,7 @@ from sqlalchemy import desc
 from . import db, BaseModel
 from .price_history import PriceHistory
 from .dividend import Dividend
-from ..constants import DECIMAL_PLACES, CURRENCY_CODES, INSTRUMENT_TYPES
+from ..constants import DECIMAL_QUANTUM, CURRENCY_CODES, INSTRUMENT_TYPES
 
 class Security(BaseModel):
     __tablename__ = 'securities'
@@ -67,7 +67,7 @@ class Security(BaseModel):
 
             price_change = (Decimal(str(current_price)) -
                           Decimal(str(historical_price.close_price))
-                          ).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                          ).quantize(DECIMAL_QUANTUM)
 
             if Decimal(str(historical_price.close_price)) > 0:
                 change_pct = ((price_change / Decimal(str(historical_price.close_price))) * 100
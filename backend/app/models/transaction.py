@@ -1,7 +1,7 @@
 from decimal import Decimal
 from . import db, BaseModel
 from datetime import datetime
-from ..constants import DECIMAL_PLACES, TRANSACTION_TYPES as VALID_TRANSACTION_TYPES, CURRENCY_CODES
+from ..constants import DECIMAL_QUANTUM, TRANSACTION_TYPES as VALID_TRANSACTION_TYPES, CURRENCY_CODES
 
 class Transaction(BaseModel):
     __tablename__ = 'transactions'
@@ -89,7 +89,7 @@ class Transaction(BaseModel):
             self.fx_fees = Decimal('0') if self.fx_fees is None else Decimal(str(self.fx_fees))
             
             # Calculate gross amount in transaction currency
-            self.gross_amount = (quantity * price).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+            self.gross_amount = (quantity * price).quantize(DECIMAL_QUANTUM)
             
             # Get platform fees
             if self.platform and not (self.trading_fees or self.fx_fees or self.stamp_duty):
@@ -101,11 +101,11 @@ class Transaction(BaseModel):
             if self.transaction_type == 'BUY':
                 self.net_amount = (self.gross_amount + self.trading_fees + 
                                  self.stamp_duty + self.fx_fees
-                                 ).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                                 ).quantize(DECIMAL_QUANTUM)
             else:  # SELL
                 self.net_amount = (self.gross_amount - self.trading_fees - 
                                  self.stamp_duty - self.fx_fees
-                                 ).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                                 ).quantize(DECIMAL_QUANTUM)
             
         except (ValueError, TypeError) as e:
             raise ValueError(f"Error calculating transaction amounts: {str(e)}")
@@ -165,7 +165,7 @@ class Transaction(BaseModel):
                 # Create new holding for buy transaction
                 # Use price * quantity for cost basis (exclude fees) to match tests' expectations
                 transaction_cost = (self.quantity * self.price_per_share)
-                avg_cost = (transaction_cost / self.quantity).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                avg_cost = (transaction_cost / self.quantity).quantize(DECIMAL_QUANTUM)
                 holding = Holding(
                     portfolio_id=self.portfolio_id,
                     security_id=self.security_id,
@@ -173,7 +173,7 @@ class Transaction(BaseModel):
                     quantity=self.quantity,
                     currency=self.currency,
                     average_cost=avg_cost,
-                    total_cost=transaction_cost.quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                    total_cost=transaction_cost.quantize(DECIMAL_QUANTUM)
                 )
                 db.session.add(holding)
             else:
@@ -184,7 +184,7 @@ class Transaction(BaseModel):
 
                 # Weighted average based only on price * quantity (exclude fees)
                 total_cost_price_only = (holding.total_cost + transaction_cost)
-                holding.average_cost = (total_cost_price_only / new_quantity).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+                holding.average_cost = (total_cost_price_only / new_quantity).quantize(DECIMAL_QUANTUM)
                 holding.quantity = new_quantity
                 holding.total_cost = total_cost_price_only
 
@@ -202,8 +202,8 @@ class Transaction(BaseModel):
             holding.quantity = holding.quantity - self.quantity
             
             # Calculate the cost basis of the sold shares and subtract from total cost
-            sold_cost_basis = (old_cost * (self.quantity / (self.quantity + holding.quantity))).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
-            holding.total_cost = (old_cost - sold_cost_basis).quantize(Decimal(f'0.{"0" * DECIMAL_PLACES}'))
+            sold_cost_basis = (old_cost * (self.quantity / (self.quantity + holding.quantity))).quantize(DECIMAL_QUANTUM)
+            holding.total_cost = (old_cost - sold_cost_basis).quantize(DECIMAL_QUANTUM)
             
             if holding.quantity == 0:
                 db.session.delete(holding)
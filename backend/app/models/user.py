@@ -5,7 +5,7 @@ from sqlalchemy import Column, Integer, String, Boolean
 from werkzeug.security import generate_password_hash, check_password_hash
 import jwt
 from datetime import datetime, timedelta
-from flask import current_app
+from flask import current_app, has_app_context
 
 class User(BaseModel):
     """
@@ -33,7 +33,13 @@ class User(BaseModel):
 
     def set_password(self, password):
         """Set the user's password hash"""
-        self.password_hash = generate_password_hash(password)
+        # PASSWORD_HASH_METHOD lets test configs trade the slow default KDF
+        # for a cheap one; check_password reads the method from the hash
+        method = has_app_context() and current_app.config.get('PASSWORD_HASH_METHOD')
+        if method:
+            self.password_hash = generate_password_hash(password, method=method)
+        else:
+            self.password_hash = generate_password_hash(password)
 
     def check_password(self, password):
         """Check if the provided password matches the hash"""
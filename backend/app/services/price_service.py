@@ -217,17 +217,24 @@ class PriceService:
         if df is None or df.empty:
             return []
 
+        # Pull each column out as a plain list once instead of building a
+        # Series per row with iterrows; missing columns yield None per row
+        def column(name):
+            return df[name].tolist() if name in df.columns else [None] * len(df)
+
         results = []
-        for idx, row in df.iterrows():
+        for idx, open_, high, low, close, volume, adj_close in zip(
+                df.index, column('Open'), column('High'), column('Low'),
+                column('Close'), column('Volume'), column('Adj Close')):
             try:
                 results.append({
                     'date': idx.date(),
-                    'open': self._to_decimal(row.get('Open')),
-                    'high': self._to_decimal(row.get('High')),
-                    'low': self._to_decimal(row.get('Low')),
-                    'close': self._to_decimal(row.get('Close')),
-                    'volume': int(row.get('Volume')) if row.get('Volume') is not None else None,
-                    'adj_close': self._to_decimal(row.get('Adj Close')) if 'Adj Close' in row.index else None
+                    'open': self._to_decimal(open_),
+                    'high': self._to_decimal(high),
+                    'low': self._to_decimal(low),
+                    'close': self._to_decimal(close),
+                    'volume': int(volume) if volume is not None else None,
+                    'adj_close': self._to_decimal(adj_close)
                 })
             except Exception:
                 continue
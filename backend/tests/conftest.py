@@ -1,8 +1,13 @@
-﻿import pytest
+import functools
+import pytest
 import tempfile
 import os
+import orjson
 from datetime import datetime, timedelta
 from decimal import Decimal
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from werkzeug.security import generate_password_hash
 from app import create_app
 from app.extensions import db
 from app.models.user import User
@@ -15,48 +20,171 @@ from app.models.dividend import Dividend
 from app.models.price_history import PriceHistory
 from app.models.security_mapping import SecurityMapping
 
+# Passwords are hashed with a single PBKDF2 iteration rather than the
+# default scrypt, both for fixture users (hashed once here) and for
+# passwords set through the API. check_password reads the method from the
+# stored hash, so logging in works exactly as before.
+PASSWORD_HASH_METHOD = "pbkdf2:sha256:1"
+TEST_PASSWORD_HASH = generate_password_hash("testpassword123", method=PASSWORD_HASH_METHOD)
+ADMIN_PASSWORD_HASH = generate_password_hash("adminpassword123", method=PASSWORD_HASH_METHOD)
+
+
+TEST_CONFIG = {
+    "TESTING": True,
+    "SQLALCHEMY_TRACK_MODIFICATIONS": False,
+    "SECRET_KEY": "test-secret-key",
+    "JWT_SECRET_KEY": "test-jwt-secret-key",
+    "WTF_CSRF_ENABLED": False,
+    "PASSWORD_HASH_METHOD": PASSWORD_HASH_METHOD,
+}
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, used for request bodies, responses
+    and ``response.get_json()`` in tests.
+
+    Datetimes and dataclasses are passed through to Flask's ``default``
+    so they serialize the same way as with the stdlib provider.
+
+    This provider is installed on the test app only; ``create_app`` keeps
+    Flask's default. The difference is deliberate, for speed, and does
+    not matter for the payloads these tests exercise, but it is not
+    byte-for-byte:
+
+    * NaN and Infinity floats become ``null`` rather than ``NaN``/``Infinity``.
+    * Integers outside the 64-bit range raise instead of serializing.
+    * ``loads`` rejects the ``NaN``/``Infinity`` literals the stdlib accepts.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_NON_STR_KEYS
+        )
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 @pytest.fixture(scope="session")
 def app():
-    db_fd, db_path = tempfile.mkstemp()
+    # FAST_TESTS=1 keeps the database in memory. Flask-SQLAlchemy serves
+    # an in-memory SQLite URI from a single StaticPool connection, so every
+    # session in the worker sees the same schema and data.
+    if os.environ.get("FAST_TESTS"):
+        db_fd, db_path = None, None
+        database_uri = "sqlite://"
+    else:
+        # Each pytest-xdist worker runs its own session, so give every
+        # worker its own database file.
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        db_fd, db_path = tempfile.mkstemp(prefix=f"test_db_{worker}_", suffix=".sqlite")
+        database_uri = f"sqlite:///{db_path}"
     
     app = create_app({
-        "TESTING": True,
-        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
-        "SQLALCHEMY_TRACK_MODIFICATIONS": False,
-        "SECRET_KEY": "test-secret-key",
-        "JWT_SECRET_KEY": "test-jwt-secret-key",
-        "WTF_CSRF_ENABLED": False
+        **TEST_CONFIG,
+        "SQLALCHEMY_DATABASE_URI": database_uri,
     })
+    app.json = OrjsonProvider(app)
     
     with app.app_context():
+        engine = db.engine
+
+        # pysqlite emits its own BEGIN lazily and knows nothing about
+        # SAVEPOINTs, which breaks nested transactions. Hand transaction
+        # control to SQLAlchemy so each test can be rolled back.
+        @event.listens_for(engine, "connect")
+        def _sqlite_connect(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+            # The test database is thrown away after the run, so skip
+            # fsyncs and keep the rollback journal and temp tables in memory.
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.close()
+
+        @event.listens_for(engine, "begin")
+        def _sqlite_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+        engine.dispose()
         db.create_all()
+        # Only takes effect while the session is bound to a connection
+        # (see db_session); commits then release a SAVEPOINT instead of
+        # ending the outer transaction.
+        db.session.configure(join_transaction_mode="create_savepoint")
         yield app
+        db.session.remove()
         db.drop_all()
     
-    os.close(db_fd)
-    os.unlink(db_path)
+    if db_path is not None:
+        os.close(db_fd)
+        os.unlink(db_path)
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def client(app):
+    # The app authenticates with bearer tokens and sets no cookies, so one
+    # client can serve every test. Isolation comes from db_session, see
+    # _isolate_app_tests.
     return app.test_client()
 
+@pytest.fixture(autouse=True)
+def _isolate_app_tests(request):
+    """Run every test that uses the app (directly or via client) inside
+    db_session, so writes made through the API are rolled back too.
+    """
+    if "app" in request.fixturenames:
+        request.getfixturevalue("db_session")
+
 @pytest.fixture(scope="function")
 def db_session(app):
-    """Provide a clean database for each test by recreating all tables.
-    This is simpler and reliable for the test-suite running against
-    SQLite in CI and avoids depending on Flask-SQLAlchemy internals.
+    """Run each test inside an outer transaction that is rolled back at
+    teardown.
+
+    The schema is created once per session by the ``app`` fixture. Here
+    ``db.session`` is bound to a single connection with an open
+    transaction; ``commit()`` calls made by tests or by request handlers
+    only release a SAVEPOINT, so every change is discarded afterwards.
     """
-    with app.app_context():
-        # Ensure a clean schema for each test
-        db.drop_all()
-        db.create_all()
-    yield db.session
-    # Clean up after test: remove session but do not drop tables here.
-    # Dropping tables at teardown could leave subsequent tests (that
-    # only use the `client` fixture) without a schema. The app-level
-    # session-scoped fixture created the initial schema; keep it in
-    # place so non-db_session tests can rely on it.
+    engines = db.engines
+    engine = engines[None]
+    connection = engine.connect()
+    transaction = connection.begin()
     db.session.remove()
+    engines[None] = connection
+    try:
+        yield db.session
+    finally:
+        db.session.remove()
+        engines[None] = engine
+        transaction.rollback()
+        connection.close()
+
+@pytest.fixture
+def query_counter(db_session):
+    """List of SQL statements executed from setup of this fixture onwards.
+
+    Clear it right before the code under test, then assert on its length
+    to put a query budget on an endpoint.
+    """
+    engine = db.engines[None].engine
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
 
 @pytest.fixture
 def sample_user(db_session, request):
@@ -78,9 +206,9 @@ def sample_user(db_session, request):
         username="testuser",
         email=email,
         first_name="Test",
-        last_name="User"
+        last_name="User",
+        password_hash=TEST_PASSWORD_HASH
     )
-    user.set_password("testpassword123")
     db_session.add(user)
     db_session.commit()
     return user
@@ -88,15 +216,31 @@ def sample_user(db_session, request):
 
 @pytest.fixture
 def admin_user(db_session):
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+    # Every test runs in its own rolled-back transaction, so a fixed
+    # username is safe and lets the admin token be cached.
     user = User(
-        username=f'admin_{timestamp}',
-        email=f'admin_{timestamp}@example.com',
+        username='adminuser',
+        email='adminuser@example.com',
         first_name='Admin',
         last_name='User',
-        is_admin=True
+        is_admin=True,
+        password_hash=ADMIN_PASSWORD_HASH
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def other_user(db_session):
+    """A second regular user, for tests about access to someone else's data."""
+    user = User(
+        username='otheruser',
+        email='other@example.com',
+        first_name='Other',
+        last_name='User',
+        password_hash=TEST_PASSWORD_HASH
     )
-    user.set_password('adminpassword123')
     db_session.add(user)
     db_session.commit()
     return user
@@ -220,23 +364,26 @@ def sample_security_mapping(db_session, sample_security, sample_platform):
     return mapping
 
 
+@functools.lru_cache(maxsize=None)
+def _token_for(user_id, username):
+    """Mint a JWT once per fixture user for the whole session.
+
+    Fixture users are recreated with the same id and username in every
+    test, so a token signed for the first one stays valid for the rest of
+    the run. The username is part of the key so a different user that
+    happens to reuse an id never gets a cached token.
+    """
+    return db.session.get(User, user_id).generate_auth_token()
+
+
 @pytest.fixture
-def auth_token(client, sample_user):
-    response = client.post('/api/auth/login', json={
-        'username': 'testuser',
-        'password': 'testpassword123'
-    })
-    return response.json['access_token']
+def auth_token(sample_user):
+    return _token_for(sample_user.id, sample_user.username)
 
 
 @pytest.fixture
-def admin_auth_token(client, admin_user):
-    # Use the username from the created admin_user fixture
-    response = client.post('/api/auth/login', json={
-        'username': admin_user.username,
-        'password': 'adminpassword123'
-    })
-    return response.json['access_token']
+def admin_auth_token(admin_user):
+    return _token_for(admin_user.id, admin_user.username)
 
 
 @pytest.fixture
@@ -13,6 +13,51 @@ from app.models.transaction import Transaction
 from app.models.holding import Holding
 
 
+# Fixed timestamp shared by all payloads; keeps request bodies deterministic.
+_FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+_FROZEN_ISO = _FROZEN_NOW.isoformat()
+
+# Expected numeric values, parsed once. Payloads send plain numbers; only
+# test_create_transaction_decimal_parsing covers string amounts.
+_D100 = Decimal('100')
+_D150 = Decimal('150')
+_D50 = Decimal('50')
+_D55 = Decimal('55')
+
+PORTFOLIO_PAYLOAD = {
+    'name': 'Test Portfolio',
+    'description': 'A test portfolio',
+    'currency': 'USD'
+}
+
+TRANSACTION_PAYLOAD = {
+    'transaction_type': 'BUY',
+    'quantity': 100,
+    'price': 50,
+    'commission': 9.99,
+    'transaction_date': _FROZEN_ISO,
+    'currency': 'USD'
+}
+
+HOLDING_PAYLOAD = {
+    'quantity': 100,
+    'average_cost': 50,
+    'currency': 'USD'
+}
+
+SECURITY_PAYLOAD = {
+    'symbol': 'NEWSTOCK',
+    'name': 'New Stock Corp',
+    'sector': 'Technology',
+    'currency': 'USD'
+}
+
+PLATFORM_PAYLOAD = {
+    'name': 'New Broker',
+    'description': 'A new trading platform'
+}
+
+
 class TestAPIEndpoints:
     """Test cases for API endpoints integration."""
     
@@ -59,8 +104,7 @@ class TestAPIEndpoints:
         })
         
         assert response.status_code == 401
-        data = response.get_json()
-        assert 'error' in data
+        assert b'error' in response.data
     
     def test_protected_endpoint_without_token(self, client):
         """Test accessing protected endpoint without token."""
@@ -74,14 +118,8 @@ class TestAPIEndpoints:
     
     def test_create_portfolio(self, client, auth_headers, sample_platform):
         """Test creating a new portfolio."""
-        response = client.post('/api/portfolios', 
-                              headers=auth_headers,
-                              json={
-                                  'name': 'Test Portfolio',
-                                  'description': 'A test portfolio',
-                                  'platform_id': sample_platform.id,
-                                  'currency': 'USD'
-                              })
+        response = client.post('/api/portfolios', headers=auth_headers,
+                               json={**PORTFOLIO_PAYLOAD, 'platform_id': sample_platform.id})
         
         assert response.status_code == 201
         data = response.get_json()
@@ -100,28 +138,19 @@ class TestAPIEndpoints:
     
     def test_create_transaction(self, client, auth_headers, sample_portfolio, sample_security):
         """Test creating a new transaction."""
-        response = client.post(f'/api/portfolios/{sample_portfolio.id}/transactions',
-                              headers=auth_headers,
-                              json={
-                                  'security_id': sample_security.id,
-                                  'transaction_type': 'BUY',
-                                  'quantity': '100',
-                                  'price': '50.00',
-                                  'commission': '9.99',
-                                  'transaction_date': datetime.now().isoformat(),
-                                  'currency': 'USD'
-                              })
+        response = client.post(f'/api/portfolios/{sample_portfolio.id}/transactions', headers=auth_headers,
+                               json={**TRANSACTION_PAYLOAD, 'security_id': sample_security.id})
         
         assert response.status_code == 201
         data = response.get_json()
         assert data['transaction_type'] == 'BUY'
-        assert float(data['quantity']) == 100.0
-        assert float(data['price']) == 50.0
+        assert Decimal(data['quantity']) == _D100
+        assert Decimal(data['price']) == _D50
     
     def test_get_transactions(self, client, auth_headers, sample_transaction):
         """Test getting portfolio transactions."""
         response = client.get(f'/api/portfolios/{sample_transaction.portfolio_id}/transactions',
-                             headers=auth_headers)
+                              headers=auth_headers)
         
         assert response.status_code == 200
         data = response.get_json()
@@ -131,24 +160,18 @@ class TestAPIEndpoints:
     
     def test_create_holding(self, client, auth_headers, sample_portfolio, sample_security):
         """Test creating a new holding."""
-        response = client.post(f'/api/portfolios/{sample_portfolio.id}/holdings',
-                              headers=auth_headers,
-                              json={
-                                  'security_id': sample_security.id,
-                                  'quantity': '100',
-                                  'average_cost': '50.00',
-                                  'currency': 'USD'
-                              })
+        response = client.post(f'/api/portfolios/{sample_portfolio.id}/holdings', headers=auth_headers,
+                               json={**HOLDING_PAYLOAD, 'security_id': sample_security.id})
         
         assert response.status_code == 201
         data = response.get_json()
         assert data['security_id'] == sample_security.id
-        assert float(data['quantity']) == 100.0
+        assert Decimal(data['quantity']) == _D100
     
     def test_get_holdings(self, client, auth_headers, sample_holding):
         """Test getting portfolio holdings."""
         response = client.get(f'/api/portfolios/{sample_holding.portfolio_id}/holdings',
-                             headers=auth_headers)
+                              headers=auth_headers)
         
         assert response.status_code == 200
         data = response.get_json()
@@ -167,14 +190,7 @@ class TestAPIEndpoints:
     
     def test_create_security(self, client, admin_auth_headers):
         """Test creating a new security (admin only)."""
-        response = client.post('/api/securities',
-                              headers=admin_auth_headers,
-                              json={
-                                  'symbol': 'NEWSTOCK',
-                                  'name': 'New Stock Corp',
-                                  'sector': 'Technology',
-                                  'currency': 'USD'
-                              })
+        response = client.post('/api/securities', headers=admin_auth_headers, json=SECURITY_PAYLOAD)
         
         assert response.status_code == 201
         data = response.get_json()
@@ -192,29 +208,32 @@ class TestAPIEndpoints:
     
     def test_create_platform(self, client, admin_auth_headers):
         """Test creating a new platform (admin only)."""
-        response = client.post('/api/platforms',
-                              headers=admin_auth_headers,
+        response = client.post('/api/platforms', headers=admin_auth_headers, json=PLATFORM_PAYLOAD)
+        
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data['name'] == 'New Broker'
+    
+    def test_create_transaction_decimal_parsing(self, client, auth_headers, sample_portfolio, sample_security):
+        """Test that string amounts in a transaction payload are parsed as decimals."""
+        response = client.post(f'/api/portfolios/{sample_portfolio.id}/transactions',
+                              headers=auth_headers,
                               json={
-                                  'name': 'New Broker',
-                                  'description': 'A new trading platform'
+                                  **TRANSACTION_PAYLOAD,
+                                  'security_id': sample_security.id,
+                                  'quantity': '100',
+                                  'price': '50.00',
+                                  'commission': '9.99'
                               })
         
         assert response.status_code == 201
         data = response.get_json()
-        assert data['name'] == 'New Broker'
+        assert Decimal(data['quantity']) == _D100
+        assert Decimal(data['price']) == _D50
+        assert Decimal(data['commission']) == Decimal('9.99')
     
-    def test_portfolio_unauthorized_access(self, client, auth_headers, db_session, sample_platform):
+    def test_portfolio_unauthorized_access(self, client, auth_headers, db_session, sample_platform, other_user):
         """Test accessing another user's portfolio."""
-        # Create another user and portfolio
-        other_user = User(
-            username='otheruser',
-            email='other@example.com',
-            first_name='Other',
-            last_name='User'
-        )
-        other_user.set_password('password')
-        db_session.add(other_user)
-        
         other_portfolio = Portfolio(
             name='Other Portfolio',
             user_id=other_user.id,
@@ -223,7 +242,7 @@ class TestAPIEndpoints:
             is_active=True
         )
         db_session.add(other_portfolio)
-        db_session.commit()
+        db_session.flush()
         
         # Try to access other user's portfolio
         response = client.get(f'/api/portfolios/{other_portfolio.id}', headers=auth_headers)
@@ -294,22 +313,21 @@ class TestAPIEndpoints:
         response = client.put(f'/api/holdings/{sample_holding.id}',
                              headers=auth_headers,
                              json={
-                                 'quantity': '150',
-                                 'average_cost': '55.00'
+                                 'quantity': 150,
+                                 'average_cost': 55
                              })
         
         assert response.status_code == 200
         data = response.get_json()
-        assert float(data['quantity']) == 150.0
-        assert float(data['average_cost']) == 55.0
+        assert Decimal(data['quantity']) == _D150
+        assert Decimal(data['average_cost']) == _D55
     
     def test_portfolio_performance_endpoint(self, client, auth_headers, sample_portfolio):
         """Test portfolio performance endpoint."""
         response = client.get(f'/api/portfolios/{sample_portfolio.id}/performance',
                              headers=auth_headers)
         
-        # This might return 200 with empty data or 404 if no performance data
-        assert response.status_code in [200, 404]
+        assert response.status_code == 200
     
     def test_dividend_endpoints(self, client, auth_headers, sample_portfolio, sample_security):
         """Test dividend-related endpoints."""
@@ -319,12 +337,11 @@ class TestAPIEndpoints:
                               json={
                                   'security_id': sample_security.id,
                                   'amount': '2.50',
-                                  'payment_date': datetime.now().isoformat(),
+                                  'payment_date': _FROZEN_ISO,
                                   'currency': 'USD'
                               })
         
-        # Should create successfully or return appropriate error
-        assert response.status_code in [201, 400, 404]
+        assert response.status_code == 201
         
         # Get dividends
         response = client.get(f'/api/portfolios/{sample_portfolio.id}/dividends',
@@ -332,22 +349,20 @@ class TestAPIEndpoints:
         
         assert response.status_code == 200
     
-    def test_rate_limiting(self, client, auth_headers):
-        """Test API rate limiting (if implemented)."""
-        # Make multiple rapid requests
-        responses = []
-        for _ in range(100):
-            response = client.get('/api/portfolios', headers=auth_headers)
-            responses.append(response.status_code)
+    def test_burst_of_reads_not_throttled(self, client, auth_headers):
+        """Test a burst of reads on an unthrottled endpoint all succeed."""
+        # /api/portfolios carries no rate_limit decorator. The login limiter
+        # is exercised in test_remote.py::test_login_rate_limit_uses_redis.
+        responses = [
+            client.get('/api/portfolios', headers=auth_headers).status_code
+            for _ in range(10)
+        ]
         
-        # Should mostly be 200, might have some 429 (Too Many Requests) if rate limiting is active
-        success_responses = [r for r in responses if r == 200]
-        assert len(success_responses) > 0  # At least some should succeed
+        assert responses == [200] * 10
     
-    def test_cors_headers(self, client):
-        """Test CORS headers are present."""
-        response = client.options('/api/portfolios')
+    def test_options_request(self, client):
+        """Test the API answers OPTIONS (CORS preflight) requests."""
+        response = client.options('/api/portfolios/')
         
-        # CORS headers might be present depending on configuration
-        # This test verifies the endpoint responds to OPTIONS
-        assert response.status_code in [200, 404, 405]
\ No newline at end of file
+        assert response.status_code == 200
+        assert {'GET', 'POST'} <= set(response.headers['Allow'].split(', '))
\ No newline at end of file
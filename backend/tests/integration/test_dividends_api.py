@@ -2,6 +2,22 @@ import pytest
 import json
 from decimal import Decimal
 from datetime import datetime, timedelta
+from sqlalchemy import select
+from app.models.dividend import Dividend
+
+
+# A +/-30 day window around today, formatted once at import
+START_DATE = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+END_DATE = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+DATE_RANGE_URL = f'/api/dividends?start_date={START_DATE}&end_date={END_DATE}'
+
+# (method, path, JSON body, send auth headers, expected status)
+ERROR_CASES = [
+    pytest.param('GET', '/api/dividends', None, False, 401, id='list-unauthorized'),
+    pytest.param('GET', '/api/dividends/99999', None, True, 404, id='get-not-found'),
+    pytest.param('PUT', '/api/dividends/99999', {'amount': '3.75'}, True, 404, id='update-not-found'),
+    pytest.param('DELETE', '/api/dividends/99999', None, True, 404, id='delete-not-found'),
+]
 
 
 class TestDividendsAPI:
@@ -16,10 +32,12 @@ class TestDividendsAPI:
         assert isinstance(data, list)
         assert len(data) >= 1
 
-    def test_get_dividends_unauthorized(self, client):
-        """Test getting dividends without authentication."""
-        response = client.get('/api/dividends')
-        assert response.status_code == 401
+    @pytest.mark.parametrize("method,path,body,authenticated,status", ERROR_CASES)
+    def test_error_responses(self, client, auth_headers, method, path, body, authenticated, status):
+        """Test unauthenticated and non-existent dividend requests."""
+        headers = auth_headers if authenticated else None
+        response = client.open(path, method=method, json=body, headers=headers)
+        assert response.status_code == status
 
     def test_get_dividend_by_id(self, client, auth_headers, sample_dividend):
         """Test getting specific dividend by ID."""
@@ -30,11 +48,6 @@ class TestDividendsAPI:
         assert data['id'] == sample_dividend.id
         assert data['amount'] == str(sample_dividend.amount)
 
-    def test_get_dividend_not_found(self, client, auth_headers):
-        """Test getting non-existent dividend."""
-        response = client.get('/api/dividends/99999', headers=auth_headers)
-        assert response.status_code == 404
-
     def test_create_dividend(self, client, auth_headers, sample_portfolio, sample_security):
         """Test creating a new dividend record."""
         dividend_data = {
@@ -91,25 +104,11 @@ class TestDividendsAPI:
         assert data['amount'] == '3.75'
         assert data['dividend_type'] == 'SPECIAL'
 
-    def test_update_dividend_not_found(self, client, auth_headers):
-        """Test updating non-existent dividend."""
-        update_data = {
-            'amount': '3.75'
-        }
-        
-        response = client.put('/api/dividends/99999', json=update_data, headers=auth_headers)
-        assert response.status_code == 404
-
     def test_delete_dividend(self, client, auth_headers, sample_dividend):
         """Test deleting a dividend."""
         response = client.delete(f'/api/dividends/{sample_dividend.id}', headers=auth_headers)
         assert response.status_code == 200
 
-    def test_delete_dividend_not_found(self, client, auth_headers):
-        """Test deleting non-existent dividend."""
-        response = client.delete('/api/dividends/99999', headers=auth_headers)
-        assert response.status_code == 404
-
     def test_get_dividends_by_portfolio(self, client, auth_headers, sample_portfolio, sample_dividend):
         """Test getting dividends for specific portfolio."""
         response = client.get(f'/api/portfolios/{sample_portfolio.id}/dividends', headers=auth_headers)
@@ -129,10 +128,7 @@ class TestDividendsAPI:
 
     def test_get_dividends_by_date_range(self, client, auth_headers, sample_dividend):
         """Test getting dividends within date range."""
-        start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-        end_date = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
-        
-        response = client.get(f'/api/dividends?start_date={start_date}&end_date={end_date}', headers=auth_headers)
+        response = client.get(DATE_RANGE_URL, headers=auth_headers)
         assert response.status_code == 200
         
         data = response.get_json()
@@ -157,24 +153,18 @@ class TestDividendsAPI:
         assert 'annual_yield' in data
         assert 'quarterly_yield' in data
 
-    def test_bulk_import_dividends(self, client, auth_headers, sample_portfolio, sample_security):
+    def test_bulk_import_dividends(self, client, db_session, auth_headers, sample_portfolio, sample_security):
         """Test bulk importing dividends."""
         dividends_data = {
             'dividends': [
                 {
                     'portfolio_id': sample_portfolio.id,
                     'security_id': sample_security.id,
-                    'amount': '2.50',
-                    'payment_date': '2024-01-15',
-                    'currency': 'USD'
-                },
-                {
-                    'portfolio_id': sample_portfolio.id,
-                    'security_id': sample_security.id,
-                    'amount': '2.75',
-                    'payment_date': '2024-04-15',
+                    'amount': f'{i}.25',
+                    'payment_date': f'2024-{i % 12 + 1:02d}-15',
                     'currency': 'USD'
                 }
+                for i in range(1, 51)
             ]
         }
         
@@ -182,8 +172,15 @@ class TestDividendsAPI:
         assert response.status_code == 201
         
         data = response.get_json()
-        assert 'imported_count' in data
-        assert data['imported_count'] == 2
+        assert data['imported_count'] == 50
+
+        imported = db_session.scalars(
+            select(Dividend.amount)
+            .filter_by(portfolio_id=sample_portfolio.id)
+            .order_by(Dividend.amount)
+            .limit(3)
+        ).all()
+        assert imported == [Decimal('1.25'), Decimal('2.25'), Decimal('3.25')]
 
     def test_get_dividends_calendar(self, client, auth_headers):
         """Test getting dividend calendar."""
@@ -4,6 +4,15 @@ from decimal import Decimal
 from datetime import datetime, timedelta
 
 
+# (method, path, JSON body, send auth headers, expected status)
+ERROR_CASES = [
+    pytest.param('GET', '/api/mappings', None, False, 401, id='list-unauthorized'),
+    pytest.param('GET', '/api/mappings/99999', None, True, 404, id='get-not-found'),
+    pytest.param('PUT', '/api/mappings/99999', {'platform_symbol': 'UPDATED'}, True, 404, id='update-not-found'),
+    pytest.param('DELETE', '/api/mappings/99999', None, True, 404, id='delete-not-found'),
+]
+
+
 class TestMappingsAPI:
     """Test security mappings API endpoints."""
 
@@ -16,10 +25,12 @@ class TestMappingsAPI:
         assert isinstance(data, list)
         assert len(data) >= 1
 
-    def test_get_mappings_unauthorized(self, client):
-        """Test getting mappings without authentication."""
-        response = client.get('/api/mappings')
-        assert response.status_code == 401
+    @pytest.mark.parametrize("method,path,body,authenticated,status", ERROR_CASES)
+    def test_error_responses(self, client, auth_headers, method, path, body, authenticated, status):
+        """Test unauthenticated and non-existent mapping requests."""
+        headers = auth_headers if authenticated else None
+        response = client.open(path, method=method, json=body, headers=headers)
+        assert response.status_code == status
 
     def test_get_mapping_by_id(self, client, auth_headers, sample_security_mapping):
         """Test getting specific mapping by ID."""
@@ -30,11 +41,6 @@ class TestMappingsAPI:
         assert data['id'] == sample_security_mapping.id
         assert data['platform_symbol'] == sample_security_mapping.platform_symbol
 
-    def test_get_mapping_not_found(self, client, auth_headers):
-        """Test getting non-existent mapping."""
-        response = client.get('/api/mappings/99999', headers=auth_headers)
-        assert response.status_code == 404
-
     def test_create_mapping(self, client, auth_headers, sample_security, sample_platform):
         """Test creating a new security mapping."""
         mapping_data = {
@@ -100,25 +106,11 @@ class TestMappingsAPI:
         assert data['platform_symbol'] == 'APPLE'
         assert data['mapping_type'] == 'FUZZY'
 
-    def test_update_mapping_not_found(self, client, auth_headers):
-        """Test updating non-existent mapping."""
-        update_data = {
-            'platform_symbol': 'UPDATED'
-        }
-        
-        response = client.put('/api/mappings/99999', json=update_data, headers=auth_headers)
-        assert response.status_code == 404
-
     def test_delete_mapping(self, client, auth_headers, sample_security_mapping):
         """Test deleting a mapping."""
         response = client.delete(f'/api/mappings/{sample_security_mapping.id}', headers=auth_headers)
         assert response.status_code == 200
 
-    def test_delete_mapping_not_found(self, client, auth_headers):
-        """Test deleting non-existent mapping."""
-        response = client.delete('/api/mappings/99999', headers=auth_headers)
-        assert response.status_code == 404
-
     def test_get_mappings_by_security(self, client, auth_headers, sample_security, sample_security_mapping):
         """Test getting mappings for specific security."""
         response = client.get(f'/api/securities/{sample_security.id}/mappings', headers=auth_headers)
@@ -2,6 +2,55 @@ import pytest
 import json
 from decimal import Decimal
 from datetime import datetime, timedelta
+from sqlalchemy import insert
+from app.models.security import Security
+from app.models.holding import Holding
+
+
+# Request bodies without fixture ids, built once for the module
+NEW_HOLDING_PAYLOAD = {
+    'quantity': '50.0',
+    'average_cost': '160.00',
+    'currency': 'USD'
+}
+
+UPDATE_HOLDING_PAYLOAD = {
+    'quantity': '75.0',
+    'average_cost': '155.00'
+}
+
+BULK_HOLDING_ROWS = [
+    {'quantity': '25.0', 'average_cost': '148.00', 'currency': 'USD'},
+    {'quantity': '30.0', 'average_cost': '152.00', 'currency': 'USD'},
+]
+
+NOTES_PAYLOAD = {
+    'notes': 'This is a long-term investment position'
+}
+
+HOLDING_ALERTS_PAYLOAD = {
+    'alerts': [
+        {
+            'type': 'PRICE_ABOVE',
+            'threshold': '170.00',
+            'enabled': True
+        },
+        {
+            'type': 'GAIN_PERCENTAGE',
+            'threshold': '10.0',
+            'enabled': True
+        }
+    ]
+}
+
+CONSOLIDATION_PAYLOAD = {
+    'strategy': 'AVERAGE_COST',
+    'target_platform_id': 1
+}
+
+# Statements allowed per request: user lookup, portfolio, holdings and one
+# batched load of their securities. Must not grow with the holding count.
+HOLDINGS_QUERY_BUDGET = 4
 
 
 class TestPortfoliosHoldingsAPI:
@@ -26,6 +75,31 @@ class TestPortfoliosHoldingsAPI:
         response = client.get('/api/portfolios/99999/holdings', headers=auth_headers)
         assert response.status_code == 404
 
+    @pytest.mark.parametrize("path", ['holdings', 'holdings/summary', 'holdings/allocation', 'holdings/performance'])
+    def test_holdings_endpoints_query_budget(self, client, db_session, query_counter, auth_headers,
+                                             sample_portfolio, sample_platform, sample_holding, path):
+        """Test that holdings endpoints do not issue a query per holding."""
+        # Seed three more holdings with one executemany INSERT per table
+        security_ids = db_session.scalars(
+            insert(Security).returning(Security.id),
+            [{'symbol': f'BUDGET{i}', 'name': f'Budget {i}', 'sector': 'Technology', 'currency': 'USD'}
+             for i in range(3)]
+        ).all()
+        db_session.execute(insert(Holding), [
+            {'portfolio_id': sample_portfolio.id, 'security_id': security_id, 'platform_id': sample_platform.id,
+             'quantity': 10, 'average_cost': 100, 'currency': 'USD'}
+            for security_id in security_ids
+        ])
+        db_session.commit()
+        portfolio_id = sample_portfolio.id
+        # Start from an empty identity map, as a real request would
+        db_session.expunge_all()
+        query_counter.clear()
+
+        response = client.get(f'/api/portfolios/{portfolio_id}/{path}', headers=auth_headers)
+        assert response.status_code == 200
+        assert len(query_counter) <= HOLDINGS_QUERY_BUDGET
+
     def test_get_specific_holding(self, client, auth_headers, sample_portfolio, sample_holding):
         """Test getting specific holding by ID."""
         response = client.get(f'/api/portfolios/{sample_portfolio.id}/holdings/{sample_holding.id}', headers=auth_headers)
@@ -43,11 +117,9 @@ class TestPortfoliosHoldingsAPI:
     def test_create_holding(self, client, auth_headers, sample_portfolio, sample_security, sample_platform):
         """Test creating a new holding."""
         holding_data = {
+            **NEW_HOLDING_PAYLOAD,
             'security_id': sample_security.id,
-            'platform_id': sample_platform.id,
-            'quantity': '50.0',
-            'average_cost': '160.00',
-            'currency': 'USD'
+            'platform_id': sample_platform.id
         }
         
         response = client.post(f'/api/portfolios/{sample_portfolio.id}/holdings', json=holding_data, headers=auth_headers)
@@ -60,10 +132,9 @@ class TestPortfoliosHoldingsAPI:
     def test_create_holding_invalid_portfolio(self, client, auth_headers, sample_security, sample_platform):
         """Test creating holding for invalid portfolio."""
         holding_data = {
+            **NEW_HOLDING_PAYLOAD,
             'security_id': sample_security.id,
-            'platform_id': sample_platform.id,
-            'quantity': '50.0',
-            'average_cost': '160.00'
+            'platform_id': sample_platform.id
         }
         
         response = client.post('/api/portfolios/99999/holdings', json=holding_data, headers=auth_headers)
@@ -71,23 +142,14 @@ class TestPortfoliosHoldingsAPI:
 
     def test_create_holding_missing_fields(self, client, auth_headers, sample_portfolio):
         """Test creating holding with missing required fields."""
-        holding_data = {
-            'quantity': '50.0'
-            # Missing security_id, platform_id, average_cost
-        }
-        
-        response = client.post(f'/api/portfolios/{sample_portfolio.id}/holdings', json=holding_data, headers=auth_headers)
+        # Missing security_id, platform_id, average_cost
+        response = client.post(f'/api/portfolios/{sample_portfolio.id}/holdings', json={'quantity': '50.0'}, headers=auth_headers)
         assert response.status_code == 400
 
     def test_update_holding(self, client, auth_headers, sample_portfolio, sample_holding):
         """Test updating an existing holding."""
-        update_data = {
-            'quantity': '75.0',
-            'average_cost': '155.00'
-        }
-        
         response = client.put(f'/api/portfolios/{sample_portfolio.id}/holdings/{sample_holding.id}', 
-                            json=update_data, headers=auth_headers)
+                            json=UPDATE_HOLDING_PAYLOAD, headers=auth_headers)
         assert response.status_code == 200
         
         data = response.get_json()
@@ -96,12 +158,8 @@ class TestPortfoliosHoldingsAPI:
 
     def test_update_holding_not_found(self, client, auth_headers, sample_portfolio):
         """Test updating non-existent holding."""
-        update_data = {
-            'quantity': '75.0'
-        }
-        
         response = client.put(f'/api/portfolios/{sample_portfolio.id}/holdings/99999', 
-                            json=update_data, headers=auth_headers)
+                            json=UPDATE_HOLDING_PAYLOAD, headers=auth_headers)
         assert response.status_code == 404
 
     def test_delete_holding(self, client, auth_headers, sample_portfolio, sample_holding):
@@ -178,20 +236,8 @@ class TestPortfoliosHoldingsAPI:
         """Test bulk importing holdings."""
         holdings_data = {
             'holdings': [
-                {
-                    'security_id': sample_security.id,
-                    'platform_id': sample_platform.id,
-                    'quantity': '25.0',
-                    'average_cost': '148.00',
-                    'currency': 'USD'
-                },
-                {
-                    'security_id': sample_security.id,
-                    'platform_id': sample_platform.id,
-                    'quantity': '30.0',
-                    'average_cost': '152.00',
-                    'currency': 'USD'
-                }
+                {**row, 'security_id': sample_security.id, 'platform_id': sample_platform.id}
+                for row in BULK_HOLDING_ROWS
             ]
         }
         
@@ -232,9 +278,15 @@ class TestPortfoliosHoldingsAPI:
 
     def test_export_holdings(self, client, auth_headers, sample_portfolio, sample_holding):
         """Test exporting holdings to CSV."""
-        response = client.get(f'/api/portfolios/{sample_portfolio.id}/holdings/export', headers=auth_headers)
+        url = f'/api/portfolios/{sample_portfolio.id}/holdings/export'
+        response = client.get(url, headers=auth_headers)
         assert response.status_code == 200
         assert response.headers['Content-Type'] == 'text/csv'
+        assert response.headers['ETag']
+
+        response = client.get(url, headers={**auth_headers, 'If-None-Match': response.headers['ETag']})
+        assert response.status_code == 304
+        assert response.data == b''
 
     def test_get_holdings_history(self, client, auth_headers, sample_portfolio, sample_holding):
         """Test getting holdings history."""
@@ -255,12 +307,8 @@ class TestPortfoliosHoldingsAPI:
 
     def test_update_holding_notes(self, client, auth_headers, sample_portfolio, sample_holding):
         """Test updating holding notes."""
-        notes_data = {
-            'notes': 'This is a long-term investment position'
-        }
-        
         response = client.put(f'/api/portfolios/{sample_portfolio.id}/holdings/{sample_holding.id}/notes', 
-                            json=notes_data, headers=auth_headers)
+                            json=NOTES_PAYLOAD, headers=auth_headers)
         assert response.status_code == 200
         
         data = response.get_json()
@@ -268,51 +316,23 @@ class TestPortfoliosHoldingsAPI:
 
     def test_set_holding_alerts(self, client, auth_headers, sample_portfolio, sample_holding):
         """Test setting alerts for a holding."""
-        alert_data = {
-            'alerts': [
-                {
-                    'type': 'PRICE_ABOVE',
-                    'threshold': '170.00',
-                    'enabled': True
-                },
-                {
-                    'type': 'GAIN_PERCENTAGE',
-                    'threshold': '10.0',
-                    'enabled': True
-                }
-            ]
-        }
-        
         response = client.post(f'/api/portfolios/{sample_portfolio.id}/holdings/{sample_holding.id}/alerts', 
-                             json=alert_data, headers=auth_headers)
+                             json=HOLDING_ALERTS_PAYLOAD, headers=auth_headers)
         assert response.status_code == 200
         
         data = response.get_json()
         assert 'alerts_count' in data
 
-    def test_get_holdings_with_filters(self, client, auth_headers, sample_portfolio, sample_holding):
-        """Test getting holdings with various filters."""
-        # Test with minimum value filter
-        response = client.get(f'/api/portfolios/{sample_portfolio.id}/holdings?min_value=1000', headers=auth_headers)
-        assert response.status_code == 200
-        
-        # Test with sector filter
-        response = client.get(f'/api/portfolios/{sample_portfolio.id}/holdings?sector=Technology', headers=auth_headers)
-        assert response.status_code == 200
-        
-        # Test with currency filter
-        response = client.get(f'/api/portfolios/{sample_portfolio.id}/holdings?currency=USD', headers=auth_headers)
+    @pytest.mark.parametrize("query", ['min_value=1000', 'sector=Technology', 'currency=USD'])
+    def test_get_holdings_with_filters(self, client, auth_headers, sample_portfolio, sample_holding, query):
+        """Test getting holdings with a minimum value, sector or currency filter."""
+        response = client.get(f'/api/portfolios/{sample_portfolio.id}/holdings?{query}', headers=auth_headers)
         assert response.status_code == 200
 
     def test_consolidate_holdings(self, client, auth_headers, sample_portfolio):
         """Test consolidating holdings for same security across platforms."""
-        consolidation_data = {
-            'strategy': 'AVERAGE_COST',
-            'target_platform_id': 1
-        }
-        
         response = client.post(f'/api/portfolios/{sample_portfolio.id}/holdings/consolidate', 
-                             json=consolidation_data, headers=auth_headers)
+                             json=CONSOLIDATION_PAYLOAD, headers=auth_headers)
         assert response.status_code == 200
         
         data = response.get_json()
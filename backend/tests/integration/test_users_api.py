@@ -103,20 +103,8 @@ class TestUsersAPI:
         data = response.get_json()
         assert data['email'] == 'updated@example.com'
 
-    def test_update_current_user_duplicate_email(self, client, sample_user, auth_headers, db_session):
+    def test_update_current_user_duplicate_email(self, client, sample_user, auth_headers, other_user):
         """Test updating current user with duplicate email."""
-        # Create another user
-        from app.models.user import User
-        other_user = User(
-            username='otheruser',
-            email='other@example.com',
-            first_name='Other',
-            last_name='User'
-        )
-        other_user.set_password('password123')
-        db_session.add(other_user)
-        db_session.commit()
-        
         update_data = {
             'email': 'other@example.com'  # Duplicate email
         }
@@ -213,19 +201,7 @@ class TestUsersAPI:
         response = client.get('/api/users', headers=auth_headers)
         assert response.status_code == 403
 
-    def test_non_admin_cannot_get_other_user(self, client, sample_user, auth_headers, db_session):
+    def test_non_admin_cannot_get_other_user(self, client, sample_user, auth_headers, other_user):
         """Test non-admin cannot get other user's information."""
-        # Create another user
-        from app.models.user import User
-        other_user = User(
-            username='otheruser',
-            email='other@example.com',
-            first_name='Other',
-            last_name='User'
-        )
-        other_user.set_password('password123')
-        db_session.add(other_user)
-        db_session.commit()
-        
         response = client.get(f'/api/users/{other_user.id}', headers=auth_headers)
         assert response.status_code == 403
\ No newline at end of file
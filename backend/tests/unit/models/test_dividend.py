@@ -8,6 +8,9 @@ from app.models.dividend import Dividend
 from app.extensions import db
 
 
+_DIVIDEND_STEP = Decimal('0.25')
+
+
 class TestDividendModel:
     """Test cases for Dividend model."""
     
@@ -67,7 +70,7 @@ class TestDividendModel:
             dividend = Dividend(
                 portfolio_id=sample_portfolio.id,
                 security_id=sample_security.id,
-                amount=Decimal('1.25') + Decimal(str(i * 0.25)),
+                amount=Decimal('1.25') + i * _DIVIDEND_STEP,
                 payment_date=datetime.now(),
                 ex_dividend_date=datetime.now() - timedelta(days=5),
                 currency=currency
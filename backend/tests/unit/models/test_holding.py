@@ -109,32 +109,20 @@ class TestHoldingModel:
         with pytest.raises(Exception):  # Should raise integrity error
             db_session.commit()
     
-    def test_holding_zero_quantity(self, db_session, sample_portfolio, sample_security, sample_platform):
-        """Test holding with zero quantity."""
+    @pytest.mark.parametrize("quantity,average_cost,expected_total_cost", [
+        pytest.param(Decimal('0'), Decimal('50.00'), Decimal('0'), id='zero-quantity'),
+        # Short position: negative total cost
+        pytest.param(Decimal('-50'), Decimal('100.00'), Decimal('-5000.00'), id='short-position'),
+    ])
+    def test_holding_non_positive_quantity(self, db_session, sample_portfolio, sample_security, sample_platform,
+                                           quantity, average_cost, expected_total_cost):
+        """Test holding with zero or negative quantity."""
         holding = Holding(
             portfolio_id=sample_portfolio.id,
             security_id=sample_security.id,
             platform_id=sample_platform.id,
-            quantity=Decimal('0'),
-            average_cost=Decimal('50.00'),
-            currency='USD',
-            last_updated=datetime.now()
-        )
-        
-        db_session.add(holding)
-        db_session.commit()
-        
-        assert holding.quantity == Decimal('0')
-        assert holding.total_cost == Decimal('0')
-    
-    def test_holding_negative_quantity(self, db_session, sample_portfolio, sample_security, sample_platform):
-        """Test holding with negative quantity (short position)."""
-        holding = Holding(
-            portfolio_id=sample_portfolio.id,
-            security_id=sample_security.id,
-            platform_id=sample_platform.id,
-            quantity=Decimal('-50'),  # Short position
-            average_cost=Decimal('100.00'),
+            quantity=quantity,
+            average_cost=average_cost,
             currency='USD',
             last_updated=datetime.now()
         )
@@ -142,8 +130,8 @@ class TestHoldingModel:
         db_session.add(holding)
         db_session.commit()
         
-        assert holding.quantity == Decimal('-50')
-        assert holding.total_cost == Decimal('-5000.00')  # Negative total cost for short
+        assert holding.quantity == quantity
+        assert holding.total_cost == expected_total_cost
     
     def test_holding_decimal_precision(self, db_session, sample_portfolio, sample_security, sample_platform):
         """Test holding with high decimal precision."""
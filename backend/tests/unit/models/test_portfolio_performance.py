@@ -117,7 +117,7 @@ class TestPortfolioPerformanceModel:
         
         for i in range(5):
             day_offset = i
-            current_value = base_value + Decimal(str(i * 100))
+            current_value = base_value + i * 100
             
             performance = PortfolioPerformance(
                 portfolio_id=sample_portfolio.id,
@@ -135,7 +135,7 @@ class TestPortfolioPerformanceModel:
         
         # Verify progression
         for i, perf in enumerate(performances):
-            expected_value = base_value + Decimal(str(i * 100))
+            expected_value = base_value + i * 100
             assert perf.total_value == expected_value
     
     def test_portfolio_performance_unique_constraint(self, db_session, sample_portfolio):
@@ -246,7 +246,7 @@ class TestPriceHistoryModel:
         prices = []
         
         for i in range(5):
-            price = Decimal('50.00') + Decimal(str(i))
+            price = Decimal('50.00') + i
             history = PriceHistory(
                 security_id=sample_security.id,
                 date=date(base_date.year, base_date.month, base_date.day + i),
@@ -265,5 +265,5 @@ class TestPriceHistoryModel:
         # Verify time series
         assert len(prices) == 5
         for i, price_history in enumerate(prices):
-            expected_close = Decimal('50.50') + Decimal(str(i))
+            expected_close = Decimal('50.50') + i
             assert price_history.close_price == expected_close
\ No newline at end of file
@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch, MagicMock
 from decimal import Decimal
 from datetime import datetime, date
 import yfinance as yf
+from sqlalchemy import func, insert, select
 from app.services.price_service import PriceService
 from app.models.security import Security
 from app.models.price_history import PriceHistory
@@ -260,16 +261,14 @@ class TestPriceService:
         """Test bulk historical price updates."""
         import pandas as pd
         
-        # Create multiple securities
-        securities = []
-        for i, symbol in enumerate(['AAPL', 'GOOGL', 'MSFT']):
-            security = Security(
-                symbol=symbol,
-                name=f'Test Company {i}',
-                currency='USD'
-            )
-            securities.append(security)
-            db_session.add(security)
+        # Create multiple securities in a single executemany INSERT
+        security_ids = db_session.scalars(
+            insert(Security).returning(Security.id),
+            [
+                {'symbol': symbol, 'name': f'Test Company {i}', 'currency': 'USD'}
+                for i, symbol in enumerate(['AAPL', 'GOOGL', 'MSFT'])
+            ]
+        ).all()
         db_session.commit()
         
         # Mock download for each symbol
@@ -288,9 +287,9 @@ class TestPriceService:
         end_date = date(2023, 1, 1)
         
         # Update all securities
-        for security in securities:
-            service.update_price_history(security.id, start_date, end_date)
+        for security_id in security_ids:
+            service.update_price_history(security_id, start_date, end_date)
         
         # Verify price history was created for all
-        price_histories = db_session.query(PriceHistory).all()
-        assert len(price_histories) == 3
\ No newline at end of file
+        assert db_session.scalar(select(func.count(PriceHistory.id))) == len(security_ids)
+        assert set(db_session.scalars(select(PriceHistory.security_id)).all()) == set(security_ids)
\ No newline at end of file